@@ -32,8 +32,9 @@ If no arguments are provided, defaults to:
 """
 
 import argparse
-
-from ps_core.workflow import create_dxf_from_csv_directory
+import logging
+import multiprocessing
+import sys
 
 
 def main():
@@ -47,6 +48,7 @@ Examples:
     python point_slice_studio_cli.py data/csv_files output.dxf         # Custom paths
     python point_slice_studio_cli.py /path/to/csv/files result.dxf     # Absolute paths
     python point_slice_studio_cli.py in/ out.dxf --anchor-x 10 --xz-rotated-x-offset -250
+    python point_slice_studio_cli.py in/ out.dxf --fast                # R12 streaming output
         """,
     )
 
@@ -124,8 +126,88 @@ Examples:
         ),
     )
 
+    parser.add_argument(
+        "--rotated-only",
+        action="store_true",
+        help=(
+            "Write XZ and YZ slices only rotated into the XY plane, without the"
+            " block at their original orientation"
+        ),
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=(
+            "Stream points straight to an R12 DXF file. Much faster for large"
+            " point clouds; layers and colors are kept but no blocks are written"
+        ),
+    )
+
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Write binary DXF: faster to save and smaller than ASCII DXF",
+    )
+
+    parser.add_argument(
+        "--no-dedup",
+        dest="dedupe",
+        action="store_false",
+        help=(
+            "Keep one POINT per input point. By default points that coincide"
+            " after rounding to 4 decimals are written once per block"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Cache parsed coordinates as <file>.csv.npy next to each CSV file;"
+            " later runs load unchanged files from the cache"
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes parsing CSV files in parallel; 0 uses one per"
+            " CPU (default: 1)"
+        ),
+    )
+
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also report every parsed file and every added block",
+    )
+    verbosity.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only report warnings and errors",
+    )
+
     args = parser.parse_args()
 
+    if args.verbose:
+        log_level = logging.DEBUG
+    elif args.quiet:
+        log_level = logging.WARNING
+    else:
+        log_level = logging.INFO
+    # Configure only our own logger; ezdxf logs its internals at INFO/DEBUG
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    ps_core_logger = logging.getLogger("ps_core")
+    ps_core_logger.addHandler(handler)
+    ps_core_logger.setLevel(log_level)
+
     # Validate colors if provided
     if args.colors:
         invalid_colors = [c for c in args.colors if c < 1 or c > 256]
@@ -135,6 +217,12 @@ Examples:
             )
             return
 
+    if args.workers < 0:
+        parser.error(f"--workers must be 0 or greater, got {args.workers}")
+
+    # Imported here so that --help and argument errors do not pay for ezdxf/numpy
+    from ps_core.workflow import create_dxf_from_csv_directory
+
     label_position = (args.label_x, args.label_y)
     anchor_point = (args.anchor_x, args.anchor_y)
 
@@ -147,8 +235,15 @@ Examples:
         colors=args.colors,
         label_position=label_position,
         threshold=args.threshold,
+        fast=args.fast,
+        dedupe=args.dedupe,
+        workers=args.workers or None,
+        binary=args.binary,
+        cache=args.cache,
+        rotated_only=args.rotated_only,
     )
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
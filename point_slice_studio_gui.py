@@ -23,6 +23,8 @@ A graphical user interface for creating DXF files from CSV point cloud data.
 Provides the same functionality as the command line version with an intuitive GUI.
 """
 
+import logging
+import multiprocessing
 import os
 import queue
 import sys
@@ -31,13 +33,11 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 from typing import List, Optional
 
-from ps_core.workflow import create_dxf_from_csv_directory
-
 _POLL_INTERVAL_MS = 50
 
 
 class RedirectText:
-    """Redirect print output to a tkinter text widget in a thread-safe way.
+    """Redirect log output to a tkinter text widget in a thread-safe way.
 
     Strings written from any thread are placed into a queue.  The main
     thread drains the queue on a timer and performs the actual widget
@@ -459,8 +459,14 @@ class PointSliceStudioGUI:
         self._redirector = RedirectText(self.log_text)
         self._redirector.start_polling()
 
-        self._old_stdout = sys.stdout
-        sys.stdout = self._redirector
+        # ps_core reports progress through logging; show all of it in the log.
+        # sys.stdout is left alone so output from other threads stays out of it.
+        self._log_handler = logging.StreamHandler(self._redirector)
+        self._log_handler.setFormatter(logging.Formatter("%(message)s"))
+        self._ps_core_logger = logging.getLogger("ps_core")
+        self._previous_log_level = self._ps_core_logger.level
+        self._ps_core_logger.addHandler(self._log_handler)
+        self._ps_core_logger.setLevel(logging.DEBUG)
 
         thread = threading.Thread(
             target=self._run_processing,
@@ -490,10 +496,14 @@ class PointSliceStudioGUI:
         """Run the actual processing in a background thread.
 
         This method only calls ``create_dxf_from_csv_directory`` (which
-        uses ``print``).  All tkinter interaction is handled by the main
-        thread via ``after`` callbacks.
+        reports through ``logging``) and writes to the log queue.  All
+        tkinter interaction is handled by the main thread via ``after``
+        callbacks.
         """
         try:
+            # Imported on first use so the window opens without waiting for ezdxf
+            from ps_core.workflow import create_dxf_from_csv_directory
+
             create_dxf_from_csv_directory(
                 input_dir,
                 output_file,
@@ -515,14 +525,17 @@ class PointSliceStudioGUI:
         except Exception as e:
             error_msg = f"An error occurred during processing:\n\n{str(e)}"
             self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
-            print(f"\n❌ Error: {str(e)}")
+            self._redirector.write(f"\n❌ Error: {str(e)}\n")
 
         finally:
+            # Detach from ps_core before anything else, so no later run sees
+            # this run's handler or the raised level
+            self._ps_core_logger.removeHandler(self._log_handler)
+            self._ps_core_logger.setLevel(self._previous_log_level)
             self.root.after(0, self._finish_processing)
 
     def _finish_processing(self):
         """Called on the main thread when the worker is done."""
-        sys.stdout = self._old_stdout
         self._redirector.stop_polling()
         self.processing = False
         self.process_button.config(text="Create DXF File", state="normal")
@@ -551,4 +564,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Process pools need this in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     main()
@@ -5,11 +5,30 @@ Test runner for the point_slice project.
 This script runs all unit tests and provides a summary of results.
 """
 
+import logging
+import os
 import unittest
 import sys
 
-def run_all_tests():
-    """Run all unit tests in the tests directory."""
+def run_all_tests(verbose=False):
+    """Run all unit tests in the tests directory.
+
+    The tests log their progress reports under the "tests" logger: timings at
+    INFO, per-file details at DEBUG. ``verbose`` shows all of them; otherwise
+    the TEST_LOG environment variable may name the level to show
+    (e.g. TEST_LOG=INFO). Unknown names fall back to INFO with a warning.
+    """
+    log_level = "DEBUG" if verbose else os.environ.get("TEST_LOG", "").upper()
+    if log_level and not isinstance(logging.getLevelName(log_level), int):
+        print(f"⚠️  Unknown TEST_LOG level '{log_level}', using INFO", file=sys.stderr)
+        log_level = "INFO"
+    if log_level:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        tests_logger = logging.getLogger("tests")
+        tests_logger.addHandler(handler)
+        tests_logger.setLevel(log_level)
+
     print("Running Point Slice Parser Tests")
     print("=" * 50)
     
@@ -50,4 +69,4 @@ def run_all_tests():
         return 1
 
 if __name__ == '__main__':
-    sys.exit(run_all_tests()) 
\ No newline at end of file
+    sys.exit(run_all_tests(verbose="-v" in sys.argv or "--verbose" in sys.argv)) 
\ No newline at end of file
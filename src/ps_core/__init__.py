@@ -1,9 +1,12 @@
 """Point Slice - Convert CSV point cloud data to DXF format."""
 
+import importlib
+
 from ps_core.points_slice import (
     Point3D,
     PointsSlice,
     SliceType,
+    quantize_xyz,
     rotate_slice_to_xy,
 )
 from ps_core.parse_file import (
@@ -11,13 +14,20 @@ from ps_core.parse_file import (
     parse_csv_file,
     parse_directory,
 )
-from ps_core.dxf_document import Block, DXFDocument
-from ps_core.workflow import create_dxf_from_csv_directory
+
+# Names from modules that import ezdxf, loaded on first access so that
+# parsing (e.g. in parse_directory worker processes) does not pay for it
+_LAZY_EXPORTS = {
+    "Block": "ps_core.dxf_document",
+    "DXFDocument": "ps_core.dxf_document",
+    "create_dxf_from_csv_directory": "ps_core.workflow",
+}
 
 __all__ = [
     "Point3D",
     "PointsSlice",
     "SliceType",
+    "quantize_xyz",
     "rotate_slice_to_xy",
     "detect_slice_type_from_data",
     "parse_csv_file",
@@ -26,3 +36,16 @@ __all__ = [
     "DXFDocument",
     "create_dxf_from_csv_directory",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
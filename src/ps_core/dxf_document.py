@@ -14,10 +14,33 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+from contextlib import suppress
+from itertools import cycle
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import ezdxf
-from typing import Optional, List
-from ps_core.points_slice import PointsSlice
+import numpy as np
+from ezdxf.addons.r12writer import r12writer
+from ezdxf.entities import factory
+from typing import Iterable, Optional, List
+from ps_core.points_slice import COORD_SCALE, PointsSlice, quantize_xyz
+
+
+def _unique_rows(coords_q: np.ndarray) -> np.ndarray:
+    """Drop repeated rows, keeping the first occurrence of each in order."""
+    if len(coords_q) < 2:
+        return coords_q
+    _, first = np.unique(coords_q, axis=0, return_index=True)
+    if len(first) == len(coords_q):
+        return coords_q
+    return coords_q[np.sort(first)]
+
+
+def _prepare_coords(xyz: np.ndarray, dedupe: bool, name: str) -> np.ndarray:
+    """Quantize a block's coordinates, optionally dropping coincident points."""
+    coords_q = quantize_xyz(xyz, name)
+    return _unique_rows(coords_q) if dedupe else coords_q
 
 
 @dataclass
@@ -33,6 +56,7 @@ class DXFDocument:
         self,
         colors: List[int] = None,
         label_start_position: tuple[float, float] = (0.0, 0.0),
+        dedupe: bool = True,
     ):
         """
         Initialize DXF document with optional color list and label position.
@@ -42,78 +66,274 @@ class DXFDocument:
                    If None, defaults to [1, 2, 3, 4, 5, 6] (red, yellow, green, cyan, blue, magenta)
             label_start_position: Starting position (x, y) for the first label. Subsequent labels
                                 will be placed below this position.
+            dedupe: Write points that coincide after rounding to 4 decimals only once
+                    per block. Set to False to keep one POINT per input point.
         """
         self.blocks: List[Block] = []
         self.dxf_doc: ezdxf.document.Drawing = ezdxf.new(setup=True)
+        # Lookups that stay the same for every block
+        self._modelspace = self.dxf_doc.modelspace()
+        self._layers = self.dxf_doc.layers
+        self._block_defs = self.dxf_doc.blocks
         self.colors = colors or [1, 2, 3, 4, 5, 6]  # Default colors
-        self.color_index = 0
         self.label_start_position = label_start_position
         self.current_label_y = label_start_position[1]
         self.text_height = 0.5
         self.text_spacing = 0.7  # Space between labels
+        self.dedupe = dedupe
+
+    def _layer_colors(self) -> dict:
+        """
+        Assign the round-robin colors to the layers the blocks will create.
+
+        Layers are numbered in order of first use, skipping empty blocks and
+        layers that already exist in the document. Keys are the layer table keys
+        (lower-cased names), so they match layers exactly as ezdxf does.
+
+        Returns:
+            Dict mapping layer table key to AutoCAD color index
+        """
+        new_layers = dict.fromkeys(
+            self._layers.key(layer_name)
+            for layer_name in (
+                block.layer_name or block.points_slice.name
+                for block in self.blocks
+                if len(block.points_slice.xyz)
+            )
+            if layer_name not in self._layers
+        )
+        return dict(zip(new_layers, cycle(self.colors)))
 
     def add_block(self, block: Block):
         self.blocks.append(block)
 
-    def save(self, filename: str):
+    def add_blocks(self, blocks: Iterable[Block]):
+        self.blocks.extend(blocks)
+
+    def save(self, filename: str, binary: bool = False):
         """
         Save the DXF document to a file.
 
         Args:
             filename: Path and filename where to save the DXF file (e.g., "output.dxf")
+            binary: Write binary DXF, which skips formatting every coordinate as
+                    text and gives smaller files
         """
-        self.dxf_doc.saveas(filename)
+        self.dxf_doc.saveas(filename, fmt="bin" if binary else "asc")
 
-    def plot(self):
+    def save_async(
+        self, filename: str, fast: bool = False, binary: bool = False
+    ) -> Future:
         """
-        Insert all blocks in the list into the DXF document.
+        Save the DXF document in a background thread.
+
+        The document must not be modified until the returned future is done.
+
+        Args:
+            filename: Path and filename where to save the DXF file (e.g., "output.dxf")
+            fast: Write with save_fast() instead of save()
+            binary: Write binary DXF
+
+        Returns:
+            Future that resolves to None once the file is written; result()
+            re-raises any error raised while saving
         """
-        for block in self.blocks:
-            # Validate that points_slice has points
-            if not block.points_slice.points:
-                continue
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dxf-save")
+        future = executor.submit(
+            self.save_fast if fast else self.save, filename, binary=binary
+        )
+        executor.shutdown(wait=False)
+        return future
 
-            # Set default names if not provided
+    def save_fast(self, filename: str, binary: bool = False):
+        """
+        Stream all blocks straight to an R12 DXF file, without plotting.
+
+        Uses ezdxf's r12writer, which writes entities directly to the file and
+        never builds a document or entity database. This is much faster for
+        point-cloud sized outputs, with these differences to plot() + save():
+
+        - no block definitions or block references are written; points and
+          labels go into modelspace, offset by the block's insert position
+        - R12 files written this way have no layer table, so the round-robin
+          layer color is set on each entity instead
+
+        Args:
+            filename: Path and filename where to save the DXF file (e.g., "output.dxf")
+            binary: Write binary DXF
+        """
+        # Write to a temporary file first: an error in a later block must not
+        # leave a truncated file behind, or replace an existing one
+        tmp_filename = filename + ".tmp"
+        try:
+            with r12writer(tmp_filename, fmt="bin" if binary else "asc") as dxf:
+                self._write_r12(dxf)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp_filename)
+            raise
+
+    def _write_r12(self, dxf):
+        """Write all blocks' points and labels through an open r12writer."""
+        layer_colors = self._layer_colors()
+        blocks = [block for block in self.blocks if len(block.points_slice.xyz)]
+        label_ys = self._label_ys(self.label_start_position[1], len(blocks))
+
+        for block, label_y in zip(blocks, label_ys):
             layer_name = block.layer_name or block.points_slice.name
-            block_name = block.block_name or block.points_slice.name
-
-            # Create the layer if it doesn't exist
-            if layer_name not in self.dxf_doc.layers:
-                # Get color in round-robin fashion only when creating a new layer
-                color = self.colors[self.color_index % len(self.colors)]
-                self.color_index += 1
-                self.dxf_doc.layers.add(layer_name, color=color)
-
-            # Create a new block definition
-            dxf_block = self.dxf_doc.blocks.new(
-                name=block_name, dxfattribs={"layer": layer_name}
+            color = layer_colors.get(self._layers.key(layer_name))
+
+            offset = np.asarray(block.insert_position or (0.0, 0.0, 0.0))
+            coords_q = _prepare_coords(
+                block.points_slice.xyz, self.dedupe, block.points_slice.name
+            )
+            coords = coords_q / COORD_SCALE + offset
+            for location in coords.tolist():
+                dxf.add_point(location, layer=layer_name, color=color)
+
+            label_position = (
+                self.label_start_position[0] + offset[0],
+                label_y + offset[1],
+                offset[2],
+            )
+            dxf.add_text(
+                block.points_slice.name,
+                insert=label_position,
+                height=self.text_height,
+                layer=layer_name,
+                color=color,
+            )
+
+    def _add_points(self, dxf_block, coords: np.ndarray, layer_attr: dict):
+        """
+        Add one POINT entity per coordinate row to a block definition.
+
+        Entities are created through the ezdxf factory and appended to the block's
+        entity space in one batch, which avoids the per-call overhead of
+        BlockLayout.add_point().
+
+        Args:
+            dxf_block: Block layout receiving the points
+            coords: (N, 3) array of point locations
+            layer_attr: DXF attributes shared by all points (e.g. the layer)
+        """
+        doc = self.dxf_doc
+        entitydb = doc.entitydb
+        block_record = dxf_block.block_record
+        owner = block_record.dxf.handle
+
+        # Look up the constructor and database methods once; handle and owner
+        # are passed to the constructor so they are set (and validated) only once
+        new_point = factory.cls("POINT").new
+        next_handle = entitydb.next_handle
+        add_to_db = entitydb.add
+
+        # One attribute dict for all points: the constructor copies it, so only
+        # the location needs replacing per point
+        dxfattribs = dict(layer_attr)
+
+        entities = []
+        append = entities.append
+        for location in coords.tolist():
+            dxfattribs["location"] = location
+            point = new_point(
+                handle=next_handle(), owner=owner, dxfattribs=dxfattribs, doc=doc
             )
+            add_to_db(point)
+            append(point)
+
+        block_record.entity_space.extend(entities)
+
+    def _add_layers(self, blocks: Iterable[Block], layer_colors: dict):
+        """
+        Create the layers of the given blocks that do not exist yet.
 
-            # Add all points to the block
-            for point in block.points_slice.points:
-                location = (
-                    round(point.x, 4),
-                    round(point.y, 4),
-                    round(point.z, 4),
-                )
-                dxf_block.add_point(location, dxfattribs={"layer": layer_name})
+        Args:
+            blocks: Blocks in plotting order
+            layer_colors: Colors for layers not created yet, as returned by
+                          _layer_colors(); entries are removed as layers are added
+        """
+        add_layer = self._layers.add
+        for block in blocks:
+            layer_name = block.layer_name or block.points_slice.name
+            # layer_colors holds exactly the layers still to be created, so no
+            # layer table lookup is needed
+            color = layer_colors.pop(self._layers.key(layer_name), None)
+            if color is not None:
+                add_layer(layer_name, color=color)
+
+    def _define_block(self, block: Block, coords_q: np.ndarray):
+        """
+        Create the block definition for a block and fill in its points.
+
+        The block's layer must already exist (see _add_layers).
+
+        Args:
+            block: Block to define
+            coords_q: (N, 3) array of the block's quantized point coordinates
+                      (see quantize_xyz)
+
+        Returns:
+            The new ezdxf block layout
+        """
+        # Set default names if not provided
+        layer_name = block.layer_name or block.points_slice.name
+        block_name = block.block_name or block.points_slice.name
+        layer_attr = {"layer": layer_name}
+
+        # Create a new block definition (blocks.new() mutates its dxfattribs)
+        dxf_block = self._block_defs.new(name=block_name, dxfattribs=dict(layer_attr))
+
+        # Add all points to the block
+        self._add_points(dxf_block, coords_q / COORD_SCALE, layer_attr)
+        return dxf_block
+
+    def _label_ys(self, start_y: float, count: int) -> List[float]:
+        """Y positions of ``count`` consecutive labels, starting at ``start_y``."""
+        return (start_y - np.arange(count) * self.text_spacing).tolist()
+
+    def _place_blocks(self, defined: List[tuple[Block, "ezdxf.layouts.BlockLayout"]]):
+        """
+        Insert block references and labels for blocks defined by _define_block().
+
+        Args:
+            defined: (block, dxf_block) pairs in plotting order
+        """
+        add_blockref = self._modelspace.add_blockref
+        label_ys = self._label_ys(self.current_label_y, len(defined))
+        for (block, dxf_block), label_y in zip(defined, label_ys):
+            layer_attr = {"layer": dxf_block.block.dxf.layer}
 
             # Insert the block into the modelspace
-            modelspace = self.dxf_doc.modelspace()
-            modelspace.add_blockref(
-                block_name,
+            add_blockref(
+                dxf_block.name,
                 insert=block.insert_position,
-                dxfattribs={"layer": layer_name},
+                dxfattribs=layer_attr,
             )
 
             # Add label text
-            label_text = block.points_slice.name
-            label_position = (self.label_start_position[0], self.current_label_y, 0.0)
-
+            label_position = (self.label_start_position[0], label_y, 0.0)
             text_entity = dxf_block.add_text(
-                label_text, dxfattribs={"height": self.text_height, "layer": layer_name}
+                block.points_slice.name,
+                dxfattribs={**layer_attr, "height": self.text_height},
             )
             text_entity.set_placement(label_position)
 
-            # Move to next label position
-            self.current_label_y -= self.text_spacing
+        # Move to next label position
+        self.current_label_y -= len(defined) * self.text_spacing
+
+    def plot(self):
+        """
+        Insert all blocks in the list into the DXF document.
+        """
+        blocks = [block for block in self.blocks if len(block.points_slice.xyz)]
+        self._add_layers(blocks, self._layer_colors())
+
+        defined = []
+        for block in blocks:
+            points_slice = block.points_slice
+            coords_q = _prepare_coords(points_slice.xyz, self.dedupe, points_slice.name)
+            defined.append((block, self._define_block(block, coords_q)))
+
+        self._place_blocks(defined)
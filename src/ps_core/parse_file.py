@@ -21,14 +21,36 @@ This module provides functionality to parse space-separated CSV files
 containing 3D point coordinates and create PointsSlice objects.
 """
 
+import json
+import logging
+import math
 import os
-import random
-from typing import Optional, List
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Optional, List, Union
+
+import numpy as np
+
 from ps_core.points_slice import Point3D, PointsSlice, SliceType
 
+logger = logging.getLogger(__name__)
+
+# Slice type for a constant Z, Y or X axis, in that order
+_CONSTANT_AXIS_SLICE_TYPES = (SliceType.XY, SliceType.XZ, SliceType.YZ)
+
+# Shared generator for drawing detection samples
+_rng = np.random.default_rng()
+
+# Appended to a CSV file path to name its coordinate cache (see parse_csv_file)
+CACHE_SUFFIX = ".npy"
+# Appended to the cache path to name the file recording which CSV it belongs to
+CACHE_KEY_SUFFIX = ".json"
+
 
 def detect_slice_type_from_data(
-    points: List[Point3D], sample_size: int = 250, threshold: float = 0.015
+    points: Union[np.ndarray, List[Point3D]],
+    sample_size: int = 250,
+    threshold: float = 0.015,
 ) -> SliceType:
     """
     Detect slice type by analyzing the point data distribution.
@@ -37,51 +59,177 @@ def detect_slice_type_from_data(
     within the threshold to identify the slice plane.
 
     Args:
-        points: List of Point3D objects to analyze
+        points: (N, 3) coordinate array or list of Point3D objects to analyze
         sample_size: Number of points to sample for analysis (for performance)
         threshold: Maximum variation allowed to consider a dimension constant
 
     Returns:
         SliceType enum value based on data analysis
     """
-    if not points:
+    if not isinstance(points, np.ndarray):
+        points = PointsSlice.from_points(points, "", SliceType.UNKNOWN).xyz
+    if not len(points):
         return SliceType.UNKNOWN
 
     # Use a random sample for performance with large datasets
-    sample_points = random.sample(points, min(len(points), sample_size))
+    if len(points) > sample_size:
+        points = points[_rng.choice(len(points), sample_size, replace=False)]
+
+    # Ranges in Z, Y, X order: argmin returns the first minimum, so ties keep
+    # preferring XY over XZ over YZ
+    ranges = np.ptp(points, axis=0)[::-1]
+    # NaN or infinite coordinates give no usable range for their axis
+    if not np.isfinite(ranges).all():
+        return SliceType.UNKNOWN
+    min_idx = int(np.argmin(ranges))
 
-    # Extract coordinates
-    xs = [p.x for p in sample_points]
-    ys = [p.y for p in sample_points]
-    zs = [p.z for p in sample_points]
+    # Check if the smallest variation is within the threshold
+    if ranges[min_idx] > threshold:
+        return SliceType.UNKNOWN
 
-    # Calculate ranges in each dimension
-    dx = max(xs) - min(xs)
-    dy = max(ys) - min(ys)
-    dz = max(zs) - min(zs)
+    # Z constant -> XY plane, Y constant -> XZ plane, X constant -> YZ plane
+    return _CONSTANT_AXIS_SLICE_TYPES[min_idx]
 
-    # Find the dimension with the smallest variation
-    min_variation = min(dx, dy, dz)
 
-    # Check if the smallest variation is within the threshold
-    if min_variation > threshold:
-        return SliceType.UNKNOWN
+def _describe_invalid_line(filepath: str) -> Optional[str]:
+    """
+    Describe the first line of a CSV file that cannot be used as a point.
+
+    np.loadtxt numbers rows inconsistently in its errors, and counts data rows
+    rather than lines, so the file is scanned again for a 1-based line number.
+    Only used once parsing has failed or returned NaN or infinite coordinates.
+
+    Returns:
+        A "Line N: ..." message, or None if no invalid line is found
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            # Like np.loadtxt, ignore "#" comments and blank lines
+            values = line.split("#", 1)[0].split()
+            if not values:
+                continue
+            if len(values) < 3:
+                return (
+                    f"Line {line_num}: Expected at least 3 values (X, Y, Z),"
+                    f" got {len(values)}"
+                )
+            try:
+                coords = [float(value) for value in values[:3]]
+            except ValueError as e:
+                return f"Line {line_num}: Invalid coordinate values - {e}"
+            if not all(map(math.isfinite, coords)):
+                return f"Line {line_num}: Non-finite coordinate values - {coords}"
+    return None
+
+
+def _read_xyz(filepath: str, max_points: Optional[int]) -> np.ndarray:
+    """Read the X, Y, Z columns of a CSV file into an (N, 3) array."""
+    try:
+        with warnings.catch_warnings():
+            # loadtxt warns about empty files and blank lines; both are handled
+            warnings.simplefilter("ignore", UserWarning)
+            xyz = np.loadtxt(
+                filepath,
+                dtype=np.float64,
+                usecols=(0, 1, 2),
+                max_rows=max_points or None,
+                ndmin=2,
+                encoding="utf-8",
+            )
+    except UnicodeDecodeError:
+        raise ValueError(
+            f"Unable to decode file {filepath}. Please check file encoding."
+        )
+    except ValueError as e:
+        # Too few columns or non-numeric values
+        raise ValueError(
+            _describe_invalid_line(filepath)
+            or f"Invalid coordinate values in {filepath} - {e}"
+        )
+
+    if not len(xyz):
+        raise ValueError(f"No valid points found in file {filepath}")
+
+    # loadtxt reads "nan" and "inf", but such points cannot be written to DXF
+    if not np.isfinite(xyz).all():
+        raise ValueError(
+            _describe_invalid_line(filepath)
+            or f"Non-finite coordinate values in {filepath}"
+        )
+
+    return xyz
 
-    # Determine slice type based on which dimension has the smallest variation
-    if min_variation == dz:
-        return SliceType.XY  # Z is constant, varies in X-Y plane
-    elif min_variation == dy:
-        return SliceType.XZ  # Y is constant, varies in X-Z plane
-    elif min_variation == dx:
-        return SliceType.YZ  # X is constant, varies in Y-Z plane
-    else:
-        return SliceType.UNKNOWN
+
+def _source_key(filepath: str) -> dict:
+    """Size and modification time identifying the current contents of a file."""
+    stat = os.stat(filepath)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_cached_xyz(filepath: str, source_key: dict) -> Optional[np.ndarray]:
+    """
+    Load the cached coordinates of a CSV file.
+
+    The cache is used only if it was written for a CSV file of exactly the
+    size and modification time in ``source_key``. Timestamps alone are not
+    enough: a file copied with its timestamps preserved or restored from a
+    backup can be older than a cache that does not belong to it.
+
+    Returns:
+        The (N, 3) array, read-only and memory-mapped from the cache file, or
+        None if there is no cache file, it was written for a different version
+        of the CSV file, or it cannot be read
+    """
+    cache_path = filepath + CACHE_SUFFIX
+    try:
+        with open(cache_path + CACHE_KEY_SUFFIX, encoding="utf-8") as f:
+            cached_key = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable cache key for {cache_path}: {e}")
+        return None
+    if cached_key != source_key:
+        return None
+
+    try:
+        # Map the file instead of reading it: pages are only loaded when used
+        xyz = np.load(cache_path, mmap_mode="r")
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable cache {cache_path}: {e}")
+        return None
+    if xyz.dtype != np.float64 or xyz.ndim != 2 or xyz.shape[1] != 3:
+        return None
+    return xyz
+
+
+def _replace_file(path: str, write):
+    """Write a file through a temporary file, so readers never see it half-written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _save_cached_xyz(filepath: str, xyz: np.ndarray, source_key: dict):
+    """Write the coordinates of a CSV file next to it, replacing any old cache."""
+    cache_path = filepath + CACHE_SUFFIX
+    key_path = cache_path + CACHE_KEY_SUFFIX
+    try:
+        # The key is written last: a cache whose key is missing is never used
+        if os.path.exists(key_path):
+            os.remove(key_path)
+        _replace_file(cache_path, lambda f: np.save(f, xyz))
+        _replace_file(key_path, lambda f: f.write(json.dumps(source_key).encode()))
+    except OSError as e:
+        logger.warning(f"Could not write cache {cache_path}: {e}")
 
 
 def parse_csv_file(
     filepath: str,
     max_points: Optional[int] = None,
     threshold: float = 0.050,
+    cache: bool = False,
 ) -> PointsSlice:
     """
     Parse a space-separated CSV file containing 3D point coordinates.
@@ -90,6 +238,11 @@ def parse_csv_file(
         filepath: Path to the CSV file to parse
         max_points: Maximum number of points to read (None for all points)
         threshold: Maximum variation allowed to consider a dimension constant
+        cache: Keep the parsed coordinates in a binary ``<filepath>.npy`` file
+               next to the CSV file, with the CSV file's size and modification
+               time in ``<filepath>.npy.json``, and load them from there while
+               both still match. Only full parses (no max_points) are written
+               to the cache. Cached coordinates are memory-mapped read-only.
 
     Returns:
         PointsSlice object containing the parsed points and metadata
@@ -104,60 +257,66 @@ def parse_csv_file(
     filename = os.path.basename(filepath)
     name = os.path.splitext(filename)[0]
 
-    points = []
-
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines
-                if not line:
-                    continue
-
-                # Split by whitespace
-                values = line.split()
-
-                # Ensure we have at least 3 values for X, Y, Z
-                if len(values) < 3:
-                    raise ValueError(
-                        f"Line {line_num}: Expected at least 3 values (X, Y, Z), got {len(values)}"
-                    )
-
-                try:
-                    x = float(values[0])
-                    y = float(values[1])
-                    z = float(values[2])
-
-                    points.append(Point3D(x, y, z))
-
-                    # Stop if we've reached the maximum points limit
-                    if max_points and len(points) >= max_points:
-                        break
+    # Taken before reading, so a file changed while being parsed is not cached
+    # under its new key
+    source_key = _source_key(filepath) if cache else None
+    xyz = _load_cached_xyz(filepath, source_key) if cache else None
+    if xyz is not None:
+        if max_points:
+            xyz = xyz[:max_points]
+    else:
+        xyz = _read_xyz(filepath, max_points)
+        if cache and not max_points:
+            _save_cached_xyz(filepath, xyz, source_key)
 
-                except ValueError as e:
-                    raise ValueError(
-                        f"Line {line_num}: Invalid coordinate values - {e}"
-                    )
+    # Determine metadata
+    slice_type = detect_slice_type_from_data(xyz, threshold=threshold)
 
-    except UnicodeDecodeError:
-        raise ValueError(
-            f"Unable to decode file {filepath}. Please check file encoding."
-        )
+    return PointsSlice(xyz=xyz, name=name, slice_type=slice_type)
 
-    if not points:
-        raise ValueError(f"No valid points found in file {filepath}")
 
-    # Determine metadata
-    slice_type = detect_slice_type_from_data(points, threshold=threshold)
+def _parse_files(
+    filepaths: List[str],
+    max_points: Optional[int],
+    threshold: float,
+    workers: Optional[int],
+    cache: bool,
+) -> Iterator[Future]:
+    """
+    Parse CSV files, yielding one completed future per file in input order.
 
-    return PointsSlice(points=points, name=name, slice_type=slice_type)
+    With ``workers`` of 1 the files are parsed in this process; otherwise they
+    are spread over a process pool (None uses the CPU count). Parse errors are
+    carried by the futures so each file can be reported on its own.
+    """
+    if workers == 1 or len(filepaths) < 2:
+        for filepath in filepaths:
+            future = Future()
+            try:
+                future.set_result(
+                    parse_csv_file(filepath, max_points, threshold, cache)
+                )
+            except Exception as e:
+                future.set_exception(e)
+            yield future
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(parse_csv_file, filepath, max_points, threshold, cache)
+            for filepath in filepaths
+        ]
+        for future in futures:
+            future.exception()  # wait for completion
+            yield future
 
 
 def parse_directory(
     directory_path: str,
     max_points_per_file: Optional[int] = None,
     threshold: float = 0.050,
+    workers: Optional[int] = 1,
+    cache: bool = False,
 ) -> List[PointsSlice]:
     """
     Parse all CSV files in a directory.
@@ -166,6 +325,10 @@ def parse_directory(
         directory_path: Path to directory containing CSV files
         max_points_per_file: Maximum points to read per file (None for all)
         threshold: Maximum variation allowed to consider a dimension constant
+        workers: Number of processes parsing files in parallel. 1 parses in the
+                 current process, None uses one process per CPU.
+        cache: Cache parsed coordinates next to each CSV file (see
+               parse_csv_file)
 
     Returns:
         List of PointsSlice objects
@@ -180,26 +343,29 @@ def parse_directory(
         raise ValueError(f"Path is not a directory: {directory_path}")
 
     slices: List[PointsSlice] = []
-    csv_files = [f for f in os.listdir(directory_path) if f.lower().endswith(".csv")]
+    # scandir reports the entry type without an extra stat() per file
+    with os.scandir(directory_path) as entries:
+        csv_files = [
+            entry.name
+            for entry in entries
+            if entry.name.lower().endswith(".csv") and entry.is_file()
+        ]
     csv_files.sort()  # Sort filenames for consistent processing order
 
     if not csv_files:
         raise ValueError(f"No CSV files found in directory: {directory_path}")
 
-    for filename in csv_files:
-        filepath = os.path.join(directory_path, filename)
+    filepaths = [os.path.join(directory_path, filename) for filename in csv_files]
+    results = _parse_files(filepaths, max_points_per_file, threshold, workers, cache)
+    for filename, future in zip(csv_files, results):
         try:
-            slice_obj = parse_csv_file(
-                filepath,
-                max_points=max_points_per_file,
-                threshold=threshold,
-            )
+            slice_obj = future.result()
             slices.append(slice_obj)
-            print(
-                f"Parsed {filename}: {len(slice_obj.points)} points, type: {slice_obj.slice_type.value}"
+            logger.debug(
+                f"Parsed {filename}: {len(slice_obj.xyz)} points, type: {slice_obj.slice_type.value}"
             )
         except Exception as e:
-            print(f"Warning: Failed to parse {filename}: {e}")
+            logger.warning(f"Failed to parse {filename}: {e}")
             continue
 
     return slices
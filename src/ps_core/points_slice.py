@@ -21,12 +21,15 @@ This module provides types for representing collections of 3D points
 along with their associated metadata such as name, color, and slice type.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, Optional
 from enum import Enum
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Point3D:
     """Represents a 3D point with x, y, z coordinates."""
 
@@ -44,21 +47,159 @@ class SliceType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+# Coordinates are kept to 4 decimal places; quantized values count 1e-4 units
+COORD_DECIMALS = 4
+COORD_SCALE = 10**COORD_DECIMALS
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def quantize_xyz(xyz: np.ndarray, name: Optional[str] = None) -> np.ndarray:
+    """
+    Quantize coordinates to integer multiples of 1 / COORD_SCALE.
+
+    Dividing the result by COORD_SCALE gives exactly ``np.round(xyz, 4)``. The
+    result is int32 when every value fits, halving the size of the float64 input;
+    otherwise (e.g. georeferenced coordinates beyond +/-214748) it is int64.
+
+    Args:
+        xyz: (N, 3) array of coordinates
+        name: Name of the slice the coordinates belong to, for error messages
+
+    Returns:
+        (N, 3) int32 or int64 array of quantized coordinates
+
+    Raises:
+        ValueError: If any coordinate is NaN or infinite, as it has no integer
+                    representation
+    """
+    scaled = np.rint(xyz * COORD_SCALE)
+    finite = np.isfinite(scaled).all(axis=1)
+    if not finite.all():
+        row = int(np.argmin(finite))
+        where = f" in slice '{name}'" if name is not None else ""
+        raise ValueError(
+            f"Non-finite coordinates{where}: {np.count_nonzero(~finite)} rows,"
+            f" first at row {row}: {xyz[row].tolist()}"
+        )
+    if scaled.size and np.abs(scaled).max() > _INT32_MAX:
+        return scaled.astype(np.int64)
+    return scaled.astype(np.int32)
+
+
+class _PointsView(Sequence):
+    """
+    Read-only sequence of Point3D objects backed by a coordinate array.
+
+    len() is O(1); Point3D objects are only created for the items accessed.
+    """
+
+    __slots__ = ("_xyz",)
+
+    def __init__(self, xyz: np.ndarray):
+        self._xyz = xyz
+
+    def __len__(self) -> int:
+        return len(self._xyz)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Point3D(x, y, z) for x, y, z in self._xyz[index].tolist()]
+        x, y, z = self._xyz[index].tolist()
+        return Point3D(x, y, z)
+
+    def __iter__(self):
+        return (Point3D(x, y, z) for x, y, z in self._xyz.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, (_PointsView, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} points>"
+
+
+@dataclass(eq=False)
 class PointsSlice:
-    """Represents a collection of 3D points with associated metadata."""
+    """
+    Represents a collection of 3D points with associated metadata.
 
-    points: List[Point3D]
+    The coordinates are stored as a contiguous (N, 3) float64 array in ``xyz``
+    (one row per point), so bulk operations run vectorized instead of touching
+    one Python object per point.
+    """
+
+    xyz: np.ndarray
     name: str
     slice_type: SliceType
 
+    def __post_init__(self):
+        xyz = np.ascontiguousarray(self.xyz, dtype=np.float64)
+        if xyz.size == 0:
+            xyz = xyz.reshape(0, 3)
+        elif xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError(
+                f"Coordinates of slice '{self.name}' must have shape (N, 3),"
+                f" got {xyz.shape}"
+            )
+        self.xyz = xyz
+
+    def __eq__(self, other):
+        # The generated dataclass __eq__ would compare the arrays elementwise
+        if not isinstance(other, PointsSlice):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.slice_type == other.slice_type
+            and np.array_equal(self.xyz, other.xyz)
+        )
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[Point3D], name: str, slice_type: SliceType
+    ) -> "PointsSlice":
+        """Build a slice from Point3D objects."""
+        xyz = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+        return cls(xyz=xyz, name=name, slice_type=slice_type)
+
+    @property
+    def x(self) -> np.ndarray:
+        """View of the X coordinates."""
+        return self.xyz[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """View of the Y coordinates."""
+        return self.xyz[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """View of the Z coordinates."""
+        return self.xyz[:, 2]
+
+    @property
+    def points(self) -> Sequence:
+        """
+        The coordinates as Point3D objects, for code that needs single points.
+
+        A read-only view of ``xyz``: len() needs no objects, and Point3D objects
+        are built only for the points indexed or iterated over.
+        """
+        return _PointsView(self.xyz)
+
+
+# Column orders mapping XZ and YZ slices onto the XY plane
+XZ_TO_XY = [0, 2, 1]
+YZ_TO_XY = [1, 2, 0]
+
 
 def rotate_slice_to_xy(slice_obj: PointsSlice) -> PointsSlice:
     """
     Rotate a slice to the XY plane.
 
     For XZ slices: Rotates around X-axis so Z becomes Y (x, y, z) -> (x, z, y)
-    For YZ slices: Rotates around Z-axis so Y becomes X (x, y, z) -> (y, x, z)
+    For YZ slices: Y becomes X and Z becomes Y (x, y, z) -> (y, z, x)
     For XY slices: Returns the slice unchanged
 
     Args:
@@ -70,29 +211,25 @@ def rotate_slice_to_xy(slice_obj: PointsSlice) -> PointsSlice:
     if slice_obj.slice_type == SliceType.XY:
         # Already in XY plane, return a copy
         return PointsSlice(
-            points=[Point3D(p.x, p.y, p.z) for p in slice_obj.points],
-            name=slice_obj.name,
-            slice_type=SliceType.XY,
+            xyz=slice_obj.xyz.copy(), name=slice_obj.name, slice_type=SliceType.XY
         )
 
     elif slice_obj.slice_type == SliceType.XZ:
         # Rotate XZ to XY: (x, y, z) -> (x, z, y)
-        rotated_points = [Point3D(p.x, p.z, p.y) for p in slice_obj.points]
+        rotated_xyz = slice_obj.xyz[:, XZ_TO_XY]
 
     elif slice_obj.slice_type == SliceType.YZ:
         # Rotate YZ to XY: (x, y, z) -> (y, z, x)
-        rotated_points = [Point3D(p.y, p.z, p.x) for p in slice_obj.points]
+        rotated_xyz = slice_obj.xyz[:, YZ_TO_XY]
 
     else:  # UNKNOWN
         # For unknown slice types, return unchanged
         return PointsSlice(
-            points=[Point3D(p.x, p.y, p.z) for p in slice_obj.points],
+            xyz=slice_obj.xyz.copy(),
             name=slice_obj.name,
             slice_type=slice_obj.slice_type,
         )
 
     return PointsSlice(
-        points=rotated_points,
-        name=f"{slice_obj.name}_rotated",
-        slice_type=SliceType.XY,
+        xyz=rotated_xyz, name=f"{slice_obj.name}_rotated", slice_type=SliceType.XY
     )
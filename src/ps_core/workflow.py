@@ -18,15 +18,94 @@
 DXF creation workflow.
 
 Orchestrates parsing CSV point cloud files and writing them to a DXF document.
+Progress is reported through the ``logging`` module; per-file and per-block
+details are logged at DEBUG level.
 """
 
+import logging
 import os
 import time
-from typing import List
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Optional
 
 from ps_core.dxf_document import DXFDocument, Block
 from ps_core.parse_file import parse_directory
-from ps_core.points_slice import SliceType, rotate_slice_to_xy
+from ps_core.points_slice import PointsSlice, SliceType, rotate_slice_to_xy
+
+logger = logging.getLogger(__name__)
+
+# Seconds between "still saving" progress messages
+SAVE_PROGRESS_INTERVAL = 2.0
+
+
+def _build_blocks(
+    points_slices: List[PointsSlice],
+    rotated_insert_positions: dict,
+    rotated_only: bool,
+) -> List[Block]:
+    """
+    Create the blocks for the parsed slices, in output order.
+
+    Args:
+        points_slices: Parsed slices
+        rotated_insert_positions: Insert position of the rotated XY copy, by the
+            slice types that get one (XZ and YZ)
+        rotated_only: Leave out the original block of slices with a rotated copy
+    """
+    # The per-block messages are only formatted when they will be shown
+    log_blocks = logger.isEnabledFor(logging.DEBUG)
+
+    blocks: List[Block] = []
+    for points_slice in points_slices:
+        layer_name = f"Layer_{points_slice.name}"
+
+        insert_position_rotated = rotated_insert_positions.get(points_slice.slice_type)
+        if insert_position_rotated is not None:
+            points_slice_rotated = rotate_slice_to_xy(points_slice)
+            block_name_rotated = f"Block_{points_slice.name}_rotated"
+            block_rotated = Block(
+                points_slice=points_slice_rotated,
+                layer_name=layer_name,
+                block_name=block_name_rotated,
+                insert_position=insert_position_rotated,
+            )
+            blocks.append(block_rotated)
+            if log_blocks:
+                logger.debug(
+                    f"➕ Added rotated block '{points_slice_rotated.name}' with {len(points_slice_rotated.xyz)} points ({points_slice_rotated.slice_type.value})"
+                )
+            if rotated_only:
+                continue
+
+        block = Block(
+            points_slice=points_slice,
+            layer_name=layer_name,
+            block_name=f"Block_{points_slice.name}",
+            insert_position=(0.0, 0.0, 0.0),
+        )
+
+        blocks.append(block)
+        if log_blocks:
+            logger.debug(
+                f"➕ Added block '{points_slice.name}' with {len(points_slice.xyz)} points ({points_slice.slice_type.value})"
+            )
+
+    return blocks
+
+
+def _wait_with_progress(future: Future, start_time: float) -> None:
+    """
+    Wait for a background save, logging progress every SAVE_PROGRESS_INTERVAL.
+
+    Re-raises any error raised while saving.
+    """
+    while True:
+        try:
+            future.result(timeout=SAVE_PROGRESS_INTERVAL)
+            return
+        except FutureTimeoutError:
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"   … still saving ({elapsed:.0f} seconds)")
 
 
 def create_dxf_from_csv_directory(
@@ -38,6 +117,12 @@ def create_dxf_from_csv_directory(
     colors: List[int] = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
     label_position: tuple[float, float] = (-40.0, 0.0),
     threshold: float = 0.050,
+    fast: bool = False,
+    dedupe: bool = True,
+    workers: Optional[int] = 1,
+    binary: bool = False,
+    cache: bool = False,
+    rotated_only: bool = False,
 ) -> None:
     """
     Create a DXF file from CSV files in a directory.
@@ -51,132 +136,121 @@ def create_dxf_from_csv_directory(
         colors: List of AutoCAD color indices to use
         label_position: Starting position for labels
         threshold: Threshold for slice-type detection
+        fast: Stream points straight to an R12 DXF file (see DXFDocument.save_fast)
+            instead of building blocks. Much faster for large point clouds, but
+            the output contains no block definitions or block references.
+        dedupe: Write points that coincide after rounding only once per block
+        workers: Number of processes parsing CSV files in parallel (1 parses in
+            the current process, None uses one process per CPU)
+        binary: Write binary DXF instead of ASCII DXF
+        cache: Cache parsed coordinates as .npy files next to the CSV files,
+            so later runs on unchanged files skip the text parsing
+        rotated_only: Write XZ and YZ slices only as their rotated XY copies,
+            leaving out the blocks at their original orientation
     """
     execution_start_time = time.perf_counter()
 
-    print("\n" + "=" * 80)
-    print("DXF DOCUMENT CREATION WORKFLOW")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("DXF DOCUMENT CREATION WORKFLOW")
+    logger.info("=" * 80)
 
     if not os.path.exists(input_directory):
-        print(f"❌ Error: Input directory '{input_directory}' does not exist")
+        logger.error(f"❌ Error: Input directory '{input_directory}' does not exist")
         return
 
     if not os.path.isdir(input_directory):
-        print(f"❌ Error: '{input_directory}' is not a directory")
+        logger.error(f"❌ Error: '{input_directory}' is not a directory")
         return
 
-    print(f"📂 Parsing CSV files from: {input_directory}")
+    logger.info(f"📂 Parsing CSV files from: {input_directory}")
     parsing_start_time = time.perf_counter()
     try:
-        points_slices = parse_directory(input_directory, threshold=threshold)
+        points_slices = parse_directory(
+            input_directory, threshold=threshold, workers=workers, cache=cache
+        )
     except Exception as e:
-        print(f"❌ Error parsing CSV files: {e}")
+        logger.error(f"❌ Error parsing CSV files: {e}")
         return
     parsing_end_time = time.perf_counter()
     parsing_duration = parsing_end_time - parsing_start_time
 
     if not points_slices:
-        print("❌ Error: No valid CSV files found or parsed")
+        logger.error("❌ Error: No valid CSV files found or parsed")
         return
 
-    print(
+    logger.info(
         f"✅ Successfully parsed {len(points_slices)} CSV files in {parsing_duration:.3f} seconds"
     )
 
-    doc = DXFDocument(colors=colors, label_start_position=label_position)
-    print(f"📋 Created initial DXFDocument")
-    print(f"🏷️  Label start position: {label_position}")
+    doc = DXFDocument(colors=colors, label_start_position=label_position, dedupe=dedupe)
+    logger.debug("📋 Created initial DXFDocument")
+    logger.debug(f"🏷️  Label start position: {label_position}")
 
-    for points_slice in points_slices:
-        layer_name = f"Layer_{points_slice.name}"
-
-        if (
-            points_slice.slice_type == SliceType.XZ
-            or points_slice.slice_type == SliceType.YZ
-        ):
-            points_slice_rotated = rotate_slice_to_xy(points_slice)
-            block_name_rotated = f"Block_{points_slice.name}_rotated"
-            insert_position_rotated = (
-                anchor_point[0]
-                + (
-                    xz_rotated_x_offset
-                    if points_slice.slice_type == SliceType.XZ
-                    else yz_rotated_x_offset
-                ),
-                anchor_point[1],
-                0.0,
-            )
-            block_rotated = Block(
-                points_slice=points_slice_rotated,
-                layer_name=layer_name,
-                block_name=block_name_rotated,
-                insert_position=insert_position_rotated,
-            )
-            doc.add_block(block_rotated)
-            print(
-                f"➕ Added rotated block '{points_slice_rotated.name}' with {len(points_slice_rotated.points)} points ({points_slice_rotated.slice_type.value})"
-            )
+    # Insert positions of the rotated copies of XZ and YZ slices
+    rotated_insert_positions = {
+        SliceType.XZ: (anchor_point[0] + xz_rotated_x_offset, anchor_point[1], 0.0),
+        SliceType.YZ: (anchor_point[0] + yz_rotated_x_offset, anchor_point[1], 0.0),
+    }
+    doc.add_blocks(_build_blocks(points_slices, rotated_insert_positions, rotated_only))
+    logger.info(f"📦 Total blocks in document: {len(doc.blocks)}")
 
-        block = Block(
-            points_slice=points_slice,
-            layer_name=layer_name,
-            block_name=f"Block_{points_slice.name}",
-            insert_position=(0.0, 0.0, 0.0),
-        )
-
-        doc.add_block(block)
-        print(
-            f"➕ Added block '{points_slice.name}' with {len(points_slice.points)} points ({points_slice.slice_type.value})"
+    plotting_duration = 0.0
+    if fast:
+        logger.info(
+            "⚡ Fast mode: streaming points to an R12 DXF file, skipping blocks"
         )
+    else:
+        logger.info("🎨 Plotting blocks to DXF document...")
+        plotting_start_time = time.perf_counter()
+        try:
+            doc.plot()
+            plotting_end_time = time.perf_counter()
+            plotting_duration = plotting_end_time - plotting_start_time
+            logger.info(
+                f"✅ Successfully plotted all blocks in {plotting_duration:.3f} seconds"
+            )
+        except Exception as e:
+            logger.error(f"❌ Error plotting blocks: {e}")
+            return
 
-    print(f"📦 Total blocks in document: {len(doc.blocks)}")
-
-    print("🎨 Plotting blocks to DXF document...")
-    plotting_start_time = time.perf_counter()
-    try:
-        doc.plot()
-        plotting_end_time = time.perf_counter()
-        plotting_duration = plotting_end_time - plotting_start_time
-        print(f"✅ Successfully plotted all blocks in {plotting_duration:.3f} seconds")
-    except Exception as e:
-        print(f"❌ Error plotting blocks: {e}")
-        return
-
-    print(f"💾 Saving DXF file to: {output_file}")
+    logger.info(f"💾 Saving DXF file to: {output_file}")
     saving_start_time = time.perf_counter()
     try:
-        doc.save(output_file)
+        _wait_with_progress(
+            doc.save_async(output_file, fast=fast, binary=binary), saving_start_time
+        )
         saving_end_time = time.perf_counter()
         saving_duration = saving_end_time - saving_start_time
 
         if os.path.exists(output_file):
-            print(f"✅ DXF file saved successfully in {saving_duration:.3f} seconds")
+            logger.info(
+                f"✅ DXF file saved successfully in {saving_duration:.3f} seconds"
+            )
         else:
-            print("❌ Error: DXF file was not created")
+            logger.error("❌ Error: DXF file was not created")
             return
 
     except Exception as e:
-        print(f"❌ Error saving DXF file: {e}")
+        logger.error(f"❌ Error saving DXF file: {e}")
         return
 
     execution_end_time = time.perf_counter()
     total_execution_time = execution_end_time - execution_start_time
 
-    print("\n📊 CREATION SUMMARY:")
-    print(f"   • CSV files parsed: {len(points_slices)}")
-    print(f"   • Blocks created: {len(doc.blocks)}")
-    print(f"   • Output file: {output_file}")
+    logger.info("\n📊 CREATION SUMMARY:")
+    logger.info(f"   • CSV files parsed: {len(points_slices)}")
+    logger.info(f"   • Blocks created: {len(doc.blocks)}")
+    logger.info(f"   • Output file: {output_file}")
 
     if os.path.exists(output_file):
         file_size = os.path.getsize(output_file)
-        print(f"   • File size: {file_size / 1024:.1f} KB")
+        logger.info(f"   • File size: {file_size / 1024:.1f} KB")
 
-    print(f"\n⏱️  TIMING BREAKDOWN:")
-    print(f"   • Parsing: {parsing_duration:.3f} seconds")
-    print(f"   • Plotting: {plotting_duration:.3f} seconds")
-    print(f"   • Saving: {saving_duration:.3f} seconds")
-    print(f"   • Total execution: {total_execution_time:.3f} seconds")
+    logger.info("\n⏱️  TIMING BREAKDOWN:")
+    logger.info(f"   • Parsing: {parsing_duration:.3f} seconds")
+    logger.info(f"   • Plotting: {plotting_duration:.3f} seconds")
+    logger.info(f"   • Saving: {saving_duration:.3f} seconds")
+    logger.info(f"   • Total execution: {total_execution_time:.3f} seconds")
 
-    print("=" * 80)
-    print("🎉 DXF creation completed successfully!")
+    logger.info("=" * 80)
+    logger.info("🎉 DXF creation completed successfully!")
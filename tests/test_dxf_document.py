@@ -1,41 +1,55 @@
 #!/usr/bin/env python3
 
+import logging
 import os
+import tempfile
 import unittest
 
+import ezdxf
+
 from ps_core.dxf_document import DXFDocument, Block
 from ps_core.parse_file import parse_directory
-from ps_core.points_slice import SliceType, rotate_slice_to_xy
+from ps_core.points_slice import Point3D, PointsSlice, SliceType, rotate_slice_to_xy
+
+# Progress reports; shown with run_tests.py --verbose or TEST_LOG=<level>
+logger = logging.getLogger(f"tests.{__name__}")
 
 
 class TestDXFDocument(unittest.TestCase):
     """Test the DXFDocument class functionality."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_data_dir = os.path.join(
+    @classmethod
+    def setUpClass(cls):
+        """Parse the test data directory once; tests must not modify the slices."""
+        cls.test_data_dir = os.path.join(
             os.path.dirname(__file__), "testdata", "02_csv"
         )
-        self.output_file = "test_output.dxf"
+        cls.points_slices = parse_directory(cls.test_data_dir)
+
+    def setUp(self):
+        """Set up test environment."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_file = os.path.join(temp_dir.name, "test_output.dxf")
 
     def test_parse_and_create_dxf_complete_workflow(self):
         """Test complete workflow: parse CSV files, create blocks, plot, and save."""
-        print("\n" + "=" * 80)
-        print("COMPLETE DXF DOCUMENT WORKFLOW TEST")
-        print("=" * 80)
+        logger.debug("\n" + "=" * 80)
+        logger.debug("COMPLETE DXF DOCUMENT WORKFLOW TEST")
+        logger.debug("=" * 80)
 
         # Step 1: Parse all CSV files from the test data directory
-        print(f"📂 Parsing CSV files from: {self.test_data_dir}")
-        points_slices = parse_directory(self.test_data_dir)
+        logger.debug(f"📂 Parsing CSV files from: {self.test_data_dir}")
+        points_slices = self.points_slices
 
-        print(f"✅ Successfully parsed {len(points_slices)} CSV files")
+        logger.debug(f"✅ Successfully parsed {len(points_slices)} CSV files")
 
         # Step 2: Create DXF document with custom colors and label position
         custom_colors = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]  # More colors for variety
         label_position = (-40.0, 0.0)
         doc = DXFDocument(colors=custom_colors, label_start_position=label_position)
-        print(f"📋 Created DXFDocument with {len(custom_colors)} colors")
-        print(f"🏷️  Label start position: {label_position}")
+        logger.debug(f"📋 Created DXFDocument with {len(custom_colors)} colors")
+        logger.debug(f"🏷️  Label start position: {label_position}")
 
         # Step 3: Add each PointsSlice as a block
         for points_slice in points_slices:
@@ -62,40 +76,206 @@ class TestDXFDocument(unittest.TestCase):
                 )
             doc.add_block(block)
 
-            print(
-                f"➕ Added block '{points_slice.name}' with {len(points_slice.points)} points"
+            logger.debug(
+                f"➕ Added block '{points_slice.name}' with {len(points_slice.xyz)} points"
             )
 
         self.assertEqual(
             len(doc.blocks), len(points_slices), "Not all blocks were added"
         )
-        print(f"📦 Total blocks in document: {len(doc.blocks)}")
+        logger.debug(f"📦 Total blocks in document: {len(doc.blocks)}")
 
         # Step 4: Plot all blocks to the DXF document
-        print("🎨 Plotting blocks to DXF document...")
+        logger.debug("🎨 Plotting blocks to DXF document...")
         doc.plot()
         self.assertIsNotNone(
             doc.dxf_doc, "DXF document should not be None after plotting"
         )
-        print("✅ Successfully plotted all blocks")
+        logger.debug("✅ Successfully plotted all blocks")
 
         # Step 5: Save the DXF file
-        print(f"💾 Saving DXF file to: {self.output_file}")
+        logger.debug(f"💾 Saving DXF file to: {self.output_file}")
         doc.save(self.output_file)
 
         # Check file size (should be > 0)
         file_size = os.path.getsize(self.output_file)
         self.assertGreater(file_size, 0, "DXF file is empty")
-        print(f"✅ DXF file saved successfully (size: {file_size} bytes)")
+        logger.debug(f"✅ DXF file saved successfully (size: {file_size} bytes)")
 
         # Step 6: Display summary
-        print("\n📊 WORKFLOW SUMMARY:")
-        print(f"   • CSV files parsed: {len(points_slices)}")
-        print(f"   • Blocks created: {len(doc.blocks)}")
-        print(f"   • Colors used: {len(custom_colors)}")
-        print(f"   • Output file: {self.output_file}")
-        print(f"   • File size: {file_size} bytes")
-        print("=" * 80)
+        logger.debug("\n📊 WORKFLOW SUMMARY:")
+        logger.debug(f"   • CSV files parsed: {len(points_slices)}")
+        logger.debug(f"   • Blocks created: {len(doc.blocks)}")
+        logger.debug(f"   • Colors used: {len(custom_colors)}")
+        logger.debug(f"   • Output file: {self.output_file}")
+        logger.debug(f"   • File size: {file_size} bytes")
+        logger.debug("=" * 80)
+
+    def test_plot_adds_rounded_points_to_block(self):
+        """Test that plot() writes every point, rounded, into its block."""
+        points_slice = PointsSlice.from_points(
+            points=[Point3D(1.23456, 2.0, 3.00004), Point3D(-0.00001, 5.5, 6.12345)],
+            name="sample",
+            slice_type=SliceType.UNKNOWN,
+        )
+        doc = DXFDocument()
+        doc.add_block(Block(points_slice=points_slice, layer_name="Layer_sample"))
+        doc.plot()
+
+        dxf_block = doc.dxf_doc.blocks.get("sample")
+        points = [e for e in dxf_block if e.dxftype() == "POINT"]
+        self.assertEqual(len(points), 2)
+        self.assertEqual(tuple(points[0].dxf.location), (1.2346, 2.0, 3.0))
+        self.assertEqual(tuple(points[1].dxf.location), (-0.0, 5.5, 6.1234))
+        for point in points:
+            self.assertEqual(point.dxf.layer, "Layer_sample")
+            self.assertEqual(point.dxf.owner, dxf_block.block_record_handle)
+            self.assertIn(point.dxf.handle, doc.dxf_doc.entitydb)
+        self.assertEqual(len(doc.dxf_doc.audit().errors), 0)
+
+    def test_plot_dedupes_coincident_points(self):
+        """Test that points equal after rounding are written once unless disabled."""
+        points_slice = PointsSlice.from_points(
+            points=[
+                Point3D(1.0, 2.0, 3.0),
+                Point3D(4.0, 5.0, 6.0),
+                Point3D(1.00001, 2.0, 3.0),
+            ],
+            name="sample",
+            slice_type=SliceType.UNKNOWN,
+        )
+
+        for dedupe, expected in (
+            (True, [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]),
+            (False, [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0), (1.0, 2.0, 3.0)]),
+        ):
+            doc = DXFDocument(dedupe=dedupe)
+            doc.add_block(Block(points_slice=points_slice))
+            doc.plot()
+            dxf_block = doc.dxf_doc.blocks.get("sample")
+            self.assertEqual(
+                [tuple(e.dxf.location) for e in dxf_block if e.dxftype() == "POINT"],
+                expected,
+            )
+
+    def test_plot_creates_layers_ezdxf_tells_apart(self):
+        """Test that layer names equal only under casefold() get their own layer."""
+        doc = DXFDocument(colors=[1, 2])
+        for index, layer_name in enumerate(("Straße", "STRASSE", "strasse")):
+            points_slice = PointsSlice.from_points(
+                points=[Point3D(1.0, 2.0, 3.0)],
+                name=f"sample{index}",
+                slice_type=SliceType.XY,
+            )
+            doc.add_block(Block(points_slice=points_slice, layer_name=layer_name))
+        doc.plot()
+
+        layers = doc.dxf_doc.layers
+        self.assertEqual(layers.get("Straße").color, 1)
+        self.assertEqual(layers.get("STRASSE").dxf.name, "STRASSE")
+        self.assertEqual(layers.get("STRASSE").color, 2)
+
+    def test_save_fast_writes_offset_points(self):
+        """Test that save_fast() streams offset points and labels to an R12 file."""
+        points_slice = PointsSlice.from_points(
+            points=[Point3D(1.0, 2.0, 0.0), Point3D(3.0, 4.0, 0.0)],
+            name="sample",
+            slice_type=SliceType.XY,
+        )
+        doc = DXFDocument(colors=[3])
+        doc.add_block(
+            Block(
+                points_slice=points_slice,
+                layer_name="Layer_sample",
+                insert_position=(100.0, 0.0, 0.0),
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "fast.dxf")
+            doc.save_fast(output_file)
+            result = ezdxf.readfile(output_file)
+
+        modelspace = result.modelspace()
+        points = modelspace.query("POINT")
+        self.assertEqual(
+            [tuple(p.dxf.location) for p in points],
+            [(101.0, 2.0, 0.0), (103.0, 4.0, 0.0)],
+        )
+        self.assertEqual(len(modelspace.query("TEXT")), 1)
+        for entity in modelspace:
+            self.assertEqual(entity.dxf.layer, "Layer_sample")
+            self.assertEqual(entity.dxf.color, 3)
+
+    def test_save_fast_error_keeps_existing_file(self):
+        """Test that a failing save_fast() leaves an existing file untouched."""
+        doc = DXFDocument()
+        for name, bad in (("good", 1.0), ("bad", float("nan"))):
+            points_slice = PointsSlice.from_points(
+                points=[Point3D(1.0, 2.0, bad)], name=name, slice_type=SliceType.XY
+            )
+            doc.add_block(Block(points_slice=points_slice))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "fast.dxf")
+            with open(output_file, "w") as f:
+                f.write("previous contents")
+            with self.assertRaises(ValueError):
+                doc.save_fast(output_file)
+
+            with open(output_file) as f:
+                self.assertEqual(f.read(), "previous contents")
+            self.assertEqual(os.listdir(temp_dir), ["fast.dxf"])
+
+    def test_save_binary(self):
+        """Test that save(binary=True) writes a readable binary DXF file."""
+        points_slice = PointsSlice.from_points(
+            points=[Point3D(1.0, 2.0, 3.0)], name="sample", slice_type=SliceType.XY
+        )
+        doc = DXFDocument()
+        doc.add_block(Block(points_slice=points_slice))
+        doc.plot()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "binary.dxf")
+            doc.save(output_file, binary=True)
+            with open(output_file, "rb") as f:
+                self.assertTrue(f.read(22).startswith(b"AutoCAD Binary DXF"))
+            result = ezdxf.readfile(output_file)
+
+        points = result.blocks.get("sample").query("POINT")
+        self.assertEqual([tuple(p.dxf.location) for p in points], [(1.0, 2.0, 3.0)])
+
+    def test_save_async(self):
+        """Test that save_async() writes a readable file in both save modes."""
+        points_slice = PointsSlice.from_points(
+            points=[Point3D(1.0, 2.0, 3.0)], name="sample", slice_type=SliceType.XY
+        )
+        for fast in (False, True):
+            doc = DXFDocument()
+            doc.add_block(Block(points_slice=points_slice))
+            if not fast:
+                doc.plot()
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_file = os.path.join(temp_dir, "async.dxf")
+                self.assertIsNone(doc.save_async(output_file, fast=fast).result())
+                result = ezdxf.readfile(output_file)
+
+            layout = result.modelspace() if fast else result.blocks.get("sample")
+            self.assertEqual(
+                [tuple(p.dxf.location) for p in layout.query("POINT")],
+                [(1.0, 2.0, 3.0)],
+            )
+
+    def test_save_async_reraises_errors(self):
+        """Test that errors raised while saving are re-raised by result()."""
+        doc = DXFDocument()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "missing", "async.dxf")
+            for fast in (False, True):
+                with self.assertRaises(OSError):
+                    doc.save_async(output_file, fast=fast).result()
 
 
 if __name__ == "__main__":
@@ -6,11 +6,15 @@ Tests cover slice type detection, color determination, file parsing,
 and directory parsing functionality.
 """
 
+import logging
 import os
 import shutil
 import tempfile
+import time
 import unittest
 
+import numpy as np
+
 from ps_core.parse_file import (
     detect_slice_type_from_data,
     parse_csv_file,
@@ -18,40 +22,53 @@ from ps_core.parse_file import (
 )
 from ps_core.points_slice import Point3D, SliceType, PointsSlice
 
+# Progress reports; shown with run_tests.py --verbose or TEST_LOG=<level>
+logger = logging.getLogger(f"tests.{__name__}")
+
 
 class TestDetectSliceType(unittest.TestCase):
     """Test the detect_slice_type_from_data function."""
 
+    @staticmethod
+    def plane(constant_axis, value):
+        """10x10 grid of points varying in two axes, constant in the third."""
+        a, b = np.mgrid[0:10, 0:10]
+        columns = [a.ravel(), b.ravel()]
+        columns.insert(constant_axis, np.full(a.size, value))
+        return np.column_stack(columns).astype(np.float64)
+
     def test_xy_slice_detection(self):
         """Test detection of XY slice (Z constant)."""
-        # Create points with constant Z (5.0) and varying X, Y
-        points = [Point3D(i, j, 5.0) for i in range(10) for j in range(10)]
-        result = detect_slice_type_from_data(points)
+        # Points with constant Z (5.0) and varying X, Y
+        result = detect_slice_type_from_data(self.plane(2, 5.0))
         self.assertEqual(result, SliceType.XY)
 
     def test_xz_slice_detection(self):
         """Test detection of XZ slice (Y constant)."""
-        # Create points with constant Y (3.0) and varying X, Z
-        points = [Point3D(i, 3.0, k) for i in range(10) for k in range(10)]
-        result = detect_slice_type_from_data(points)
+        # Points with constant Y (3.0) and varying X, Z
+        result = detect_slice_type_from_data(self.plane(1, 3.0))
         self.assertEqual(result, SliceType.XZ)
 
     def test_yz_slice_detection(self):
         """Test detection of YZ slice (X constant)."""
-        # Create points with constant X (2.0) and varying Y, Z
-        points = [Point3D(2.0, j, k) for j in range(10) for k in range(10)]
-        result = detect_slice_type_from_data(points)
+        # Points with constant X (2.0) and varying Y, Z
+        result = detect_slice_type_from_data(self.plane(0, 2.0))
         self.assertEqual(result, SliceType.YZ)
 
+    def test_point3d_list_input(self):
+        """Test that lists of Point3D objects are still accepted."""
+        for constant_axis, expected in (
+            (2, SliceType.XY),
+            (1, SliceType.XZ),
+            (0, SliceType.YZ),
+        ):
+            points = [Point3D(*row) for row in self.plane(constant_axis, 1.0)]
+            self.assertEqual(detect_slice_type_from_data(points), expected)
+
     def test_unknown_slice_detection(self):
         """Test detection when no dimension is constant enough."""
-        # Create 3D point cloud with significant variation in all dimensions
-        points = [
-            Point3D(i * 0.1, j * 0.1, k * 0.1)
-            for i in range(10)
-            for j in range(10)
-            for k in range(10)
-        ]
+        # 3D point cloud with significant variation in all dimensions
+        points = np.mgrid[0:10, 0:10, 0:10].reshape(3, -1).T * 0.1
         result = detect_slice_type_from_data(points)
         self.assertEqual(result, SliceType.UNKNOWN)
 
@@ -61,15 +78,30 @@ class TestDetectSliceType(unittest.TestCase):
         result = detect_slice_type_from_data(points)
         self.assertEqual(result, SliceType.UNKNOWN)
 
+    def test_non_finite_points(self):
+        """Test that a NaN or infinite coordinate gives an unknown slice."""
+        for bad in (np.nan, np.inf):
+            # A YZ plane with one bad X value
+            points = self.plane(0, 2.0)
+            points[5, 0] = bad
+            result = detect_slice_type_from_data(points)
+            self.assertEqual(result, SliceType.UNKNOWN)
+
+    def test_tie_prefers_xy(self):
+        """Test that equally constant axes resolve to XY, then XZ."""
+        self.assertEqual(
+            detect_slice_type_from_data([Point3D(1.0, 2.0, 3.0)]), SliceType.XY
+        )
+        points = [Point3D(i, 3.0, 2.0) for i in range(10)]
+        self.assertEqual(detect_slice_type_from_data(points), SliceType.XY)
+        points = [Point3D(2.0, 3.0, k) for k in range(10)]
+        self.assertEqual(detect_slice_type_from_data(points), SliceType.XZ)
+
     def test_custom_threshold(self):
         """Test with custom threshold values."""
-        # Create points with small but measurable Z variation
-        points = [
-            Point3D(i, j, 5.0 + k * 0.01)
-            for i in range(5)
-            for j in range(5)
-            for k in range(3)
-        ]
+        # Points with small but measurable Z variation
+        i, j, k = np.mgrid[0:5, 0:5, 0:3].reshape(3, -1)
+        points = np.column_stack([i, j, 5.0 + k * 0.01])
 
         # With strict threshold, should be UNKNOWN
         result_strict = detect_slice_type_from_data(points, threshold=0.005)
@@ -83,21 +115,27 @@ class TestDetectSliceType(unittest.TestCase):
 class TestParseCSVFile(unittest.TestCase):
     """Test the parse_csv_file function."""
 
-    def setUp(self):
-        """Set up temporary files for testing."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up temporary files for testing.
+
+        The sample file is shared and must not be modified; tests that need
+        other files create them in the temporary directory under their own name.
+        """
+        cls.temp_dir = tempfile.mkdtemp()
 
         # Create a sample CSV file
-        self.test_file = os.path.join(self.temp_dir, "test_data.csv")
-        with open(self.test_file, "w") as f:
+        cls.test_file = os.path.join(cls.temp_dir, "test_data.csv")
+        with open(cls.test_file, "w") as f:
             # XY slice data (Z constant at ~5.0)
             for i in range(10):
                 for j in range(10):
                     f.write(f"{i}.{i} {j}.{j} 5.000 100.0 0 201 54\n")
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files."""
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
 
     def test_parse_valid_file(self):
         """Test parsing a valid CSV file."""
@@ -115,6 +153,44 @@ class TestParseCSVFile(unittest.TestCase):
         self.assertEqual(len(result.points), 50)
         self.assertEqual(result.slice_type, SliceType.XY)
 
+    def test_parse_with_cache(self):
+        """Test that parsed coordinates are cached and reloaded while unchanged."""
+        csv_file = os.path.join(self.temp_dir, "cached.csv")
+        shutil.copyfile(self.test_file, csv_file)
+        cache_file = csv_file + ".npy"
+        result = parse_csv_file(csv_file, cache=True)
+        self.assertTrue(os.path.exists(cache_file))
+
+        # The cache is used instead of the CSV file while the CSV is unchanged
+        np.save(cache_file, result.xyz[:10])
+        self.assertEqual(len(parse_csv_file(csv_file, cache=True).xyz), 10)
+        self.assertFalse(
+            parse_csv_file(csv_file, cache=True).xyz.flags.writeable,
+            "Cached coordinates should be memory-mapped read-only",
+        )
+
+        # A touched CSV file invalidates the cache, which is then rewritten
+        mtime_ns = os.stat(csv_file).st_mtime_ns + 1_000_000_000
+        os.utime(csv_file, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(len(parse_csv_file(csv_file, cache=True).xyz), 100)
+        self.assertEqual(len(np.load(cache_file)), 100)
+
+    def test_cache_ignored_for_replaced_csv_with_older_mtime(self):
+        """Test that a CSV file replaced by an older-dated file is parsed again."""
+        csv_file = os.path.join(self.temp_dir, "replaced.csv")
+        shutil.copyfile(self.test_file, csv_file)
+        parse_csv_file(csv_file, cache=True)
+
+        # Replace the file with other contents dated before the cache, as a
+        # copy preserving timestamps or a restore from backup would
+        with open(csv_file, "w") as f:
+            f.write("1.0 2.0 3.0\n4.0 5.0 6.0\n")
+        cache_mtime = os.stat(csv_file + ".npy").st_mtime
+        os.utime(csv_file, (cache_mtime - 3600, cache_mtime - 3600))
+
+        result = parse_csv_file(csv_file, cache=True)
+        np.testing.assert_array_equal(result.xyz, [[1, 2, 3], [4, 5, 6]])
+
     def test_parse_nonexistent_file(self):
         """Test parsing a file that doesn't exist."""
         with self.assertRaises(FileNotFoundError):
@@ -139,6 +215,27 @@ class TestParseCSVFile(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_csv_file(invalid_file)
 
+    def test_invalid_line_numbers(self):
+        """Test that errors name the 1-based line, counting blank and comment lines."""
+        invalid_file = os.path.join(self.temp_dir, "invalid_lines.csv")
+        for second_row, expected in (
+            ("4.0 5.0", "^Line 4: Expected at least 3 values \\(X, Y, Z\\), got 2$"),
+            ("4.0 x 6.0", "^Line 4: Invalid coordinate values - .*'x'"),
+        ):
+            with open(invalid_file, "w") as f:
+                f.write(f"1.0 2.0 3.0\n\n# comment\n{second_row}\n7.0 8.0 9.0\n")
+            with self.assertRaisesRegex(ValueError, expected):
+                parse_csv_file(invalid_file)
+
+    def test_parse_non_finite_coordinates(self):
+        """Test that NaN and infinite coordinates are rejected when parsing."""
+        invalid_file = os.path.join(self.temp_dir, "non_finite.csv")
+        for bad in ("nan", "inf", "-inf"):
+            with open(invalid_file, "w") as f:
+                f.write(f"1.0 2.0 3.0\n{bad} 4.0 5.0\n")
+            with self.assertRaisesRegex(ValueError, "^Line 2: Non-finite"):
+                parse_csv_file(invalid_file)
+
     def test_parse_non_numeric_coordinates(self):
         """Test parsing file with non-numeric coordinates."""
         invalid_file = os.path.join(self.temp_dir, "non_numeric.csv")
@@ -152,62 +249,79 @@ class TestParseCSVFile(unittest.TestCase):
 class TestParseAllTestData(unittest.TestCase):
     """Test parsing all CSV files in the testdata/02_csv directory using parse_directory."""
 
-    def setUp(self):
-        """Set up paths for test data."""
-        self.test_data_dir = os.path.join(
+    @classmethod
+    def setUpClass(cls):
+        """Parse the test data directory once for all tests in this class."""
+        cls.test_data_dir = os.path.join(
             os.path.dirname(__file__), "testdata", "02_csv"
         )
-        self.assertTrue(
-            os.path.exists(self.test_data_dir),
-            f"Test data directory not found: {self.test_data_dir}",
-        )
+        if not os.path.exists(cls.test_data_dir):
+            raise FileNotFoundError(
+                f"Test data directory not found: {cls.test_data_dir}"
+            )
+
+        start_time = time.perf_counter()
+        cls.results = parse_directory(cls.test_data_dir)
+        cls.execution_time = time.perf_counter() - start_time
 
     def test_parse_directory_all_files(self):
         """Parse all CSV files using parse_directory function and analyze results."""
-        print("\n" + "=" * 80)
-        print("PARSING ALL TEST DATA FILES WITH parse_directory()")
-        print("=" * 80)
-
-        try:
-            # Use parse_directory with limited points for faster testing
-            import time
-
-            start_time = time.time()
-            results = parse_directory(self.test_data_dir)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            print(f"⏱️  Parsing execution time: {execution_time:.4f} seconds")
-
-            print(f"✅ Successfully parsed directory: {self.test_data_dir}")
-            print(f"📊 Total slices parsed: {len(results)}")
-
-            # Verify we have results
-            self.assertGreater(len(results), 0, "No slices were parsed from directory")
-
-            # Analyze each slice
-            for i, slice_obj in enumerate(results, 1):
-                print(f"\n📁 Slice {i}: {slice_obj.name}")
-                print(f"   📊 Points parsed: {len(slice_obj.points)}")
-                print(f"   🎯 Slice type: {slice_obj.slice_type.value}")
-
-                # Validate that each slice is a PointsSlice object
-                self.assertIsInstance(
-                    slice_obj, PointsSlice, f"Result {i} is not a PointsSlice object"
-                )
-                self.assertGreater(
-                    len(slice_obj.points), 0, f"Slice {slice_obj.name} has no points"
-                )
-
-        except Exception as e:
-            self.fail(f"Failed to parse directory: {str(e)}")
+        logger.debug("\n" + "=" * 80)
+        logger.debug("PARSING ALL TEST DATA FILES WITH parse_directory()")
+        logger.debug("=" * 80)
+
+        results = self.results
+        logger.info(f"⏱️  Parsing execution time: {self.execution_time:.4f} seconds")
+
+        logger.debug(f"✅ Successfully parsed directory: {self.test_data_dir}")
+        logger.debug(f"📊 Total slices parsed: {len(results)}")
+
+        # Verify we have results
+        self.assertGreater(len(results), 0, "No slices were parsed from directory")
+
+        # Analyze each slice
+        for i, slice_obj in enumerate(results, 1):
+            logger.debug(f"\n📁 Slice {i}: {slice_obj.name}")
+            logger.debug(f"   📊 Points parsed: {len(slice_obj.xyz)}")
+            logger.debug(f"   🎯 Slice type: {slice_obj.slice_type.value}")
+
+            # Validate that each slice is a PointsSlice object
+            self.assertIsInstance(
+                slice_obj, PointsSlice, f"Result {i} is not a PointsSlice object"
+            )
+            self.assertGreater(
+                len(slice_obj.xyz), 0, f"Slice {slice_obj.name} has no points"
+            )
 
         # Summary analysis
-        print("\n" + "=" * 80)
-        print("SUMMARY ANALYSIS")
-        print("=" * 80)
-        print(f"Total slices processed: {len(results)}")
+        logger.debug("\n" + "=" * 80)
+        logger.debug("SUMMARY ANALYSIS")
+        logger.debug("=" * 80)
+        logger.debug(f"Total slices processed: {len(results)}")
+
+        # Every CSV file must come back as a slice; parse_directory only logs
+        # files it fails to parse, so a dropped file would otherwise go unnoticed
+        with os.scandir(self.test_data_dir) as entries:
+            expected_names = sorted(
+                os.path.splitext(entry.name)[0]
+                for entry in entries
+                if entry.name.lower().endswith(".csv") and entry.is_file()
+            )
+        self.assertEqual(
+            [slice_obj.name for slice_obj in results],
+            expected_names,
+            f"Expected {len(expected_names)} files, got {len(results)}",
+        )
 
-        self.assertEqual(len(results), 10, f"Expected 6 files, got {len(results)}")
+    def test_parse_directory_parallel_matches_serial(self):
+        """Test that parsing with a process pool gives the same slices in order."""
+        serial = self.results
+        parallel = parse_directory(self.test_data_dir, workers=2)
+
+        self.assertEqual([s.name for s in parallel], [s.name for s in serial])
+        for serial_slice, parallel_slice in zip(serial, parallel):
+            np.testing.assert_array_equal(parallel_slice.xyz, serial_slice.xyz)
+            self.assertEqual(parallel_slice.slice_type, serial_slice.slice_type)
 
     def test_directory_error_handling(self):
         """Test error handling for parse_directory function."""
@@ -222,7 +336,21 @@ class TestParseAllTestData(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_directory(temp_dir)
 
-        print("✅ Directory error handling tests passed!")
+        logger.debug("✅ Directory error handling tests passed!")
+
+    def test_directory_skips_non_finite_file(self):
+        """Test that a file with NaN coordinates is skipped, not the whole run."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "bad.csv"), "w") as f:
+                f.write("1.0 2.0 3.0\nnan 4.0 5.0\n")
+            with open(os.path.join(temp_dir, "good.csv"), "w") as f:
+                f.write("1.0 2.0 3.0\n4.0 5.0 3.0\n")
+
+            with self.assertLogs("ps_core.parse_file", "WARNING") as logs:
+                slices = parse_directory(temp_dir)
+
+        self.assertEqual([s.name for s in slices], ["good"])
+        self.assertIn("bad.csv", logs.output[0])
 
 
 if __name__ == "__main__":
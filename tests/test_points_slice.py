@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the points_slice module.
+
+Tests cover coordinate storage, quantization and slice rotation.
+"""
+
+import unittest
+
+import numpy as np
+
+from ps_core.points_slice import (
+    COORD_SCALE,
+    Point3D,
+    PointsSlice,
+    SliceType,
+    quantize_xyz,
+    rotate_slice_to_xy,
+)
+
+
+class TestQuantizeXYZ(unittest.TestCase):
+    """Test the quantize_xyz function."""
+
+    def test_matches_rounding(self):
+        """Test that quantized values scale back to the 4-decimal rounding."""
+        xyz = np.random.default_rng(0).uniform(-1000.0, 1000.0, (1000, 3))
+        result = quantize_xyz(xyz)
+
+        self.assertEqual(result.dtype, np.int32)
+        np.testing.assert_array_equal(result / COORD_SCALE, np.round(xyz, 4))
+
+    def test_large_coordinates_use_int64(self):
+        """Test that coordinates beyond the int32 range are not truncated."""
+        xyz = np.array([[412345.12345, 4201234.56789, 12.5]])
+        result = quantize_xyz(xyz)
+
+        self.assertEqual(result.dtype, np.int64)
+        np.testing.assert_array_equal(result / COORD_SCALE, np.round(xyz, 4))
+
+    def test_non_finite_coordinates_raise(self):
+        """Test that NaN and infinite coordinates are rejected, naming the slice."""
+        for bad in (np.nan, np.inf, -np.inf):
+            xyz = np.array([[1.0, 2.0, 3.0], [4.0, bad, 6.0]])
+            with self.assertRaisesRegex(ValueError, "slice 'sample'.*row 1"):
+                quantize_xyz(xyz, "sample")
+
+
+class TestPointsSlice(unittest.TestCase):
+    """Test the PointsSlice array storage."""
+
+    def test_from_points(self):
+        """Test that Point3D input is stored as an (N, 3) array with column views."""
+        points = [Point3D(1.0, 2.0, 3.0), Point3D(4.0, 5.0, 6.0)]
+        result = PointsSlice.from_points(points, "s", SliceType.XY)
+
+        self.assertEqual(result.xyz.shape, (2, 3))
+        np.testing.assert_array_equal(result.x, [1.0, 4.0])
+        np.testing.assert_array_equal(result.y, [2.0, 5.0])
+        np.testing.assert_array_equal(result.z, [3.0, 6.0])
+        self.assertEqual(result.points, points)
+
+    def test_points_view(self):
+        """Test that points is a read-only view of xyz."""
+        points_slice = PointsSlice(
+            xyz=np.arange(12.0).reshape(4, 3), name="s", slice_type=SliceType.XY
+        )
+        points = points_slice.points
+
+        self.assertEqual(len(points), 4)
+        self.assertEqual(points[1], Point3D(3.0, 4.0, 5.0))
+        self.assertEqual(points[-1], Point3D(9.0, 10.0, 11.0))
+        self.assertEqual(points[1:3], [Point3D(3.0, 4.0, 5.0), Point3D(6.0, 7.0, 8.0)])
+        self.assertEqual(list(points)[0], Point3D(0.0, 1.0, 2.0))
+        with self.assertRaises(IndexError):
+            points[4]
+
+    def test_empty(self):
+        """Test that an empty slice still has an (0, 3) array."""
+        result = PointsSlice(xyz=[], name="s", slice_type=SliceType.UNKNOWN)
+
+        self.assertEqual(result.xyz.shape, (0, 3))
+        self.assertEqual(result.points, [])
+
+    def test_equality(self):
+        """Test that slices compare equal by coordinates, name and slice type."""
+        xyz = np.arange(6.0).reshape(2, 3)
+        points_slice = PointsSlice(xyz=xyz, name="s", slice_type=SliceType.XY)
+
+        self.assertEqual(
+            points_slice, PointsSlice(xyz=xyz.copy(), name="s", slice_type=SliceType.XY)
+        )
+        self.assertNotEqual(
+            points_slice, PointsSlice(xyz=xyz + 1, name="s", slice_type=SliceType.XY)
+        )
+        self.assertNotEqual(
+            points_slice, PointsSlice(xyz=xyz, name="t", slice_type=SliceType.XY)
+        )
+        self.assertNotEqual(
+            points_slice, PointsSlice(xyz=xyz, name="s", slice_type=SliceType.XZ)
+        )
+
+    def test_invalid_shape(self):
+        """Test that coordinates not shaped (N, 3) are rejected, not reshaped."""
+        for shape in ((3, 4), (4, 4), (12,)):
+            with self.assertRaises(ValueError):
+                PointsSlice(xyz=np.zeros(shape), name="s", slice_type=SliceType.UNKNOWN)
+
+
+class TestRotateSliceToXY(unittest.TestCase):
+    """Test the rotate_slice_to_xy function."""
+
+    def setUp(self):
+        """Create a small slice to rotate."""
+        self.points = [Point3D(1.0, 2.0, 3.0), Point3D(4.0, 5.0, 6.0)]
+
+    def test_xz_rotation(self):
+        """Test that XZ slices map (x, y, z) -> (x, z, y)."""
+        result = rotate_slice_to_xy(
+            PointsSlice.from_points(self.points, "s", SliceType.XZ)
+        )
+
+        self.assertEqual(result.slice_type, SliceType.XY)
+        self.assertEqual(result.name, "s_rotated")
+        self.assertEqual(
+            result.points, [Point3D(1.0, 3.0, 2.0), Point3D(4.0, 6.0, 5.0)]
+        )
+        np.testing.assert_array_equal(result.xyz, [[1, 3, 2], [4, 6, 5]])
+
+    def test_yz_rotation(self):
+        """Test that YZ slices map (x, y, z) -> (y, z, x)."""
+        result = rotate_slice_to_xy(
+            PointsSlice.from_points(self.points, "s", SliceType.YZ)
+        )
+
+        self.assertEqual(result.slice_type, SliceType.XY)
+        self.assertEqual(
+            result.points, [Point3D(2.0, 3.0, 1.0), Point3D(5.0, 6.0, 4.0)]
+        )
+        np.testing.assert_array_equal(result.xyz, [[2, 3, 1], [5, 6, 4]])
+
+    def test_xy_returns_copy(self):
+        """Test that XY slices are returned unchanged but not shared."""
+        original = PointsSlice.from_points(self.points, "s", SliceType.XY)
+        result = rotate_slice_to_xy(original)
+
+        self.assertEqual(result.name, "s")
+        self.assertEqual(result.points, self.points)
+        self.assertIsNot(result.xyz, original.xyz)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
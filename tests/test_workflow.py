@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the workflow module.
+
+Tests cover which blocks create_dxf_from_csv_directory writes for each slice type.
+"""
+
+import os
+import tempfile
+import unittest
+
+import ezdxf
+import numpy as np
+
+from ps_core.workflow import create_dxf_from_csv_directory
+
+
+class TestCreateDXFFromCSVDirectory(unittest.TestCase):
+    """Test the create_dxf_from_csv_directory function."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write one XY, one XZ and one YZ slice into a temporary directory."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.input_dir = os.path.join(cls.temp_dir.name, "csv")
+        os.mkdir(cls.input_dir)
+
+        a, b = np.mgrid[0:10, 0:10]
+        a, b = a.ravel() * 0.1, b.ravel() * 0.1
+        constant = np.full(a.size, 2.0)
+        for name, xyz in (
+            ("flat", np.column_stack([a, b, constant])),
+            ("front", np.column_stack([a, constant, b])),
+            ("side", np.column_stack([constant, a, b])),
+        ):
+            np.savetxt(os.path.join(cls.input_dir, f"{name}.csv"), xyz, fmt="%.4f")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def block_names(self, **kwargs):
+        """Run the workflow and return the names of the blocks inserted."""
+        output_file = os.path.join(self.temp_dir.name, "output.dxf")
+        create_dxf_from_csv_directory(self.input_dir, output_file, **kwargs)
+        modelspace = ezdxf.readfile(output_file).modelspace()
+        return sorted(insert.dxf.name for insert in modelspace.query("INSERT"))
+
+    def test_rotated_copies_added(self):
+        """Test that XZ and YZ slices are written as-is and as rotated copies."""
+        self.assertEqual(
+            self.block_names(),
+            [
+                "Block_flat",
+                "Block_front",
+                "Block_front_rotated",
+                "Block_side",
+                "Block_side_rotated",
+            ],
+        )
+
+    def test_rotated_only(self):
+        """Test that rotated_only leaves out the original XZ and YZ blocks."""
+        self.assertEqual(
+            self.block_names(rotated_only=True),
+            ["Block_flat", "Block_front_rotated", "Block_side_rotated"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()